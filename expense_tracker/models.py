@@ -1,21 +1,41 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+import sys
+from dataclasses import dataclass, field
 from datetime import date
 from typing import Dict, Any
 
-from .utils import parse_date, validate_amount, validate_category, validate_description
+from .utils import parse_date, parse_iso_date, validate_all
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Expense:
     date: date
     category: str
     description: str
     amount: float
+    # Lowercased category, computed once so filtering doesn't re-lower per query.
+    category_lc: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Categories come from a small vocabulary; interning shares one str
+        # per distinct value across all rows.
+        object.__setattr__(self, "category", sys.intern(self.category))
+        object.__setattr__(self, "category_lc", sys.intern(self.category.lower()))
 
     @staticmethod
-    def from_dict(data: Dict[str, Any]) -> "Expense":
+    def from_dict(data: Dict[str, Any], *, trusted: bool = False) -> "Expense":
+        # Records written by ExpenseStore were validated on the way in, so the
+        # reload path skips stripping and field validation. Dates still go
+        # through the same strict YYYY-MM-DD gate as parse_date's fast path.
+        if trusted:
+            return Expense(
+                date=parse_iso_date(data["date"]),
+                category=data["category"],
+                description=data["description"],
+                amount=float(data["amount"]),
+            )
+
         d = parse_date(str(data.get("date", "")).strip())
         if d is None:
             raise ValueError(f"Invalid date in file: {data.get('date')}")
@@ -28,13 +48,14 @@ class Expense:
         except (TypeError, ValueError):
             raise ValueError(f"Invalid amount in file: {data.get('amount')}")
 
-        validate_category(category)
-        validate_description(description)
-        validate_amount(amount)
+        validate_all(category, description, amount)
 
         return Expense(date=d, category=category, description=description, amount=amount)
 
     def to_dict(self) -> Dict[str, Any]:
-        payload = asdict(self)
-        payload["date"] = self.date.isoformat()
-        return payload
+        return {
+            "date": self.date.isoformat(),
+            "category": self.category,
+            "description": self.description,
+            "amount": self.amount,
+        }
@@ -1,50 +1,186 @@
 from __future__ import annotations
 
 import json
+import os
+import warnings
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, TextIO, Tuple
 
 from .models import Expense
 
-DEFAULT_DB_PATH = Path("expenses.json")
+DEFAULT_DB_PATH = Path("expenses.jsonl")
+
+# Reused for every record; save() streams records one at a time.
+_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _encode_record(expense: Expense) -> bytes:
+    return (_encode(expense.to_dict()) + "\n").encode("utf-8")
 
 
 class ExpenseStore:
-    def __init__(self, db_path: Path = DEFAULT_DB_PATH) -> None:
+    def __init__(self, db_path: Path = DEFAULT_DB_PATH, autosave: bool = True) -> None:
         self.db_path = db_path
-        self.expenses: List[Expense] = []
+        self.autosave = autosave
+        # flush() appends _pending (encoded records) when the file is otherwise
+        # current; _dirty means it must instead be rewritten from _expenses.
+        # _checked records that db_path holds JSON Lines safe to append to.
+        self._pending: List[bytes] = []
+        self._dirty = False
+        self._checked = False
+        self._expenses: List[Expense] = []
+        self._total = 0.0
+        self._totals_by_cat: Dict[str, float] = {}
+
+    @property
+    def expenses(self) -> List[Expense]:
+        return self._expenses
+
+    @expenses.setter
+    def expenses(self, expenses: List[Expense]) -> None:
+        self._expenses = list(expenses)
+        self._reindex()
+        self._dirty = True
+
+    def __enter__(self) -> "ExpenseStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.flush()
+
+    def _reindex(self) -> None:
+        self._total = 0.0
+        self._totals_by_cat = {}
+        for e in self._expenses:
+            self._count(e)
+
+    def _count(self, expense: Expense) -> None:
+        self._total += expense.amount
+        k = expense.category_lc
+        self._totals_by_cat[k] = self._totals_by_cat.get(k, 0.0) + expense.amount
 
     def load(self) -> None:
-        if not self.db_path.exists():
-            self.expenses = []
+        self.flush()
+        source = self._source_path()
+        if not source.exists():
+            self._expenses = []
+            self._reindex()
             return
 
+        self._expenses, rewrite = self._read(source)
+        self._reindex()
+        self._checked = True
+        if rewrite or source != self.db_path:
+            self._dirty = True
+            if self.autosave:
+                self.flush()
+
+    def _source_path(self) -> Path:
+        if not self.db_path.exists() and self.db_path.suffix == ".jsonl":
+            return self.db_path.with_suffix(".json")
+        return self.db_path
+
+    def _read(self, path: Path) -> Tuple[List[Expense], bool]:
         try:
-            raw = json.loads(self.db_path.read_text(encoding="utf-8"))
-            if not isinstance(raw, list):
-                raise ValueError("DB file must contain a JSON list.")
-            self.expenses = [Expense.from_dict(item) for item in raw]
+            with path.open("r", encoding="utf-8") as f:
+                legacy = self._first_char(f) == "["
+                f.seek(0)
+                if legacy:
+                    return self._load_legacy(f), True
+                return self._load_lines(path, f)
         except Exception as e:
-            raise RuntimeError(f"Failed to load database '{self.db_path}': {e}") from e
+            raise RuntimeError(f"Failed to load database '{path}': {e}") from e
+
+    def _load_lines(self, path: Path, f: TextIO) -> Tuple[List[Expense], bool]:
+        expenses = []
+        for n, line in enumerate(f, start=1):
+            if line.isspace():
+                continue
+            try:
+                expenses.append(self._parse_line(n, line))
+            except ValueError:
+                # An unterminated last line is an interrupted append.
+                if line.endswith("\n"):
+                    raise
+                warnings.warn(f"Skipped incomplete last line {n} of '{path}'", RuntimeWarning)
+                return expenses, True
+        return expenses, False
+
+    @staticmethod
+    def _first_char(f: TextIO) -> str:
+        while True:
+            chunk = f.read(4096)
+            if not chunk:
+                return ""
+            chunk = chunk.lstrip()
+            if chunk:
+                return chunk[0]
+
+    @staticmethod
+    def _load_legacy(f: TextIO) -> List[Expense]:
+        return [Expense.from_dict(item, trusted=True) for item in json.load(f)]
+
+    @staticmethod
+    def _parse_line(lineno: int, line: str) -> Expense:
+        try:
+            item = json.loads(line)
+            if not isinstance(item, dict):
+                raise ValueError("expected a JSON object")
+            return Expense.from_dict(item, trusted=True)
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"line {lineno}: {e}") from e
 
     def save(self) -> None:
-        data = [e.to_dict() for e in self.expenses]
-        self.db_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        with self.db_path.open("wb") as f:
+            f.writelines(map(_encode_record, self._expenses))
+        self._pending = []
+        self._dirty = False
+        self._checked = True
+
+    def flush(self) -> None:
+        if self._dirty:
+            self.save()
+        elif self._pending:
+            if not self._checked:
+                self._migrate()
+            with self.db_path.open("a+b") as f:
+                payload = b"".join(self._pending)
+                # Don't join the first new record onto an unterminated last line.
+                if f.tell() > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        payload = b"\n" + payload
+                f.write(payload)
+            self._pending = []
+
+    def _migrate(self) -> None:
+        source = self._source_path()
+        if source.exists():
+            expenses, rewrite = self._read(source)
+            if rewrite or source != self.db_path:
+                with self.db_path.open("wb") as f:
+                    f.writelines(map(_encode_record, expenses))
+        self._checked = True
 
     def add_expense(self, expense: Expense) -> None:
-        self.expenses.append(expense)
-        self.save()
+        record = _encode_record(expense)
+        self._expenses.append(expense)
+        self._count(expense)
+        self._pending.append(record)
+        if self.autosave:
+            self.flush()
 
     def list_expenses(self) -> List[Expense]:
-        return list(self.expenses)
+        return list(self._expenses)
 
     def total_spending(self, category: Optional[str] = None) -> float:
         if category is None:
-            return sum(e.amount for e in self.expenses)
-
-        cat = category.strip().lower()
-        return sum(e.amount for e in self.expenses if e.category.lower() == cat)
+            return self._total
+        return self._totals_by_cat.get(category.strip().lower(), 0.0)
 
     def clear_all(self) -> None:
-        self.expenses = []
-        self.save()
+        self._expenses = []
+        self._reindex()
+        self._dirty = True
+        if self.autosave:
+            self.flush()
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import re
 from datetime import datetime, date
 from typing import Optional
 
+# date.fromisoformat also accepts forms like "20251216" on 3.11+, so only
+# hand it strings already shaped like YYYY-MM-DD.
+_ISO_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
 
 def parse_date(value: str) -> Optional[date]:
     """
@@ -12,31 +17,46 @@ def parse_date(value: str) -> Optional[date]:
     value = value.strip()
     if not value:
         return None
+
+    # Fast path for the well-formed case; strptime handles the rest
+    # (e.g. non-zero-padded "2025-1-5").
+    if _ISO_DATE.match(value):
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            return None
+
     try:
         return datetime.strptime(value, "%Y-%m-%d").date()
     except ValueError:
         return None
 
 
-def validate_amount(amount: float) -> None:
-    if amount <= 0:
-        raise ValueError("Amount must be greater than 0.")
+def parse_iso_date(value: str) -> date:
+    """
+    Parse a strict YYYY-MM-DD string into a date object.
+    Raise ValueError if it is not in exactly that form.
+    """
+    if not _ISO_DATE.match(value):
+        raise ValueError(f"Invalid date: {value!r}")
+    return date.fromisoformat(value)
 
 
-def validate_category(category: str) -> None:
-    category = category.strip()
+def validate_all(category: str, description: str, amount: float) -> None:
+    """
+    Validate an expense's fields, raising ValueError on the first failure.
+    Expects category and description already stripped.
+    """
     if not category:
         raise ValueError("Category cannot be empty.")
     if len(category) > 30:
         raise ValueError("Category too long (max 30 characters).")
-
-
-def validate_description(description: str) -> None:
-    description = description.strip()
     if not description:
         raise ValueError("Description cannot be empty.")
     if len(description) > 120:
         raise ValueError("Description too long (max 120 characters).")
+    if amount <= 0:
+        raise ValueError("Amount must be greater than 0.")
 
 
 def safe_int_input(prompt: str) -> Optional[int]:
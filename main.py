@@ -1,12 +1,13 @@
 # main.py (entry point only)
 
+import sys
+from typing import Callable, Dict
+
 from expense_tracker.models import Expense
 from expense_tracker.store import ExpenseStore
 from expense_tracker.utils import (
     parse_date,
-    validate_amount,
-    validate_category,
-    validate_description,
+    validate_all,
     safe_int_input,
     safe_float_input,
 )
@@ -22,9 +23,8 @@ def print_menu() -> None:
 
 
 def format_expense(idx: int, e: Expense) -> str:
-    return (
-        f"{idx:>3}. {e.date.isoformat()} | "
-        f"{e.category:<12} | {e.amount:>10.2f} | {e.description}"
+    return "%3d. %s | %-12s | %10.2f | %s" % (
+        idx, e.date.isoformat(), e.category, e.amount, e.description
     )
 
 
@@ -44,9 +44,7 @@ def add_expense_flow(store: ExpenseStore) -> None:
             if amount is None:
                 raise ValueError("Amount must be a number.")
 
-            validate_category(category)
-            validate_description(description)
-            validate_amount(amount)
+            validate_all(category, description, amount)
 
             store.add_expense(
                 Expense(date=d, category=category, description=description, amount=amount)
@@ -64,9 +62,9 @@ def view_expenses_flow(store: ExpenseStore) -> None:
         print("No expenses added yet.")
         return
 
-    print("\nList of all expenses:")
-    for i, e in enumerate(items, start=1):
-        print(format_expense(i, e))
+    # One write for the whole listing instead of a print per row.
+    rows = "\n".join([format_expense(i, e) for i, e in enumerate(items, start=1)])
+    sys.stdout.write("\nList of all expenses:\n" + rows + "\n")
 
 
 def total_spending_flow(store: ExpenseStore) -> None:
@@ -84,6 +82,14 @@ def total_by_category_flow(store: ExpenseStore) -> None:
     print(f"Total spending for '{category}': {total:.2f}")
 
 
+DISPATCH: Dict[int, Callable[[ExpenseStore], None]] = {
+    1: add_expense_flow,
+    2: view_expenses_flow,
+    3: total_spending_flow,
+    4: total_by_category_flow,
+}
+
+
 def main() -> None:
     print("Welcome to Expense Tracker")
 
@@ -93,7 +99,7 @@ def main() -> None:
     except RuntimeError as e:
         print(e)
         print("Starting with an empty list (your DB file may be corrupted).")
-        store.clear_all()  # implement this in store.py (simple)
+        store.clear_all()
 
     while True:
         print_menu()
@@ -103,14 +109,9 @@ def main() -> None:
             print("Invalid input. Enter a number like 1, 2, 3...")
             continue
 
-        if choice == 1:
-            add_expense_flow(store)
-        elif choice == 2:
-            view_expenses_flow(store)
-        elif choice == 3:
-            total_spending_flow(store)
-        elif choice == 4:
-            total_by_category_flow(store)
+        handler = DISPATCH.get(choice)
+        if handler is not None:
+            handler(store)
         elif choice == 5:
             print("Thanks for using Expense Tracker.")
             break
@@ -5,7 +5,7 @@ from datetime import date
 
 from expense_tracker.models import Expense
 from expense_tracker.store import ExpenseStore
-from expense_tracker.utils import parse_date
+from expense_tracker.utils import parse_date, validate_all
 
 
 def test_parse_date_valid():
@@ -15,10 +15,31 @@ def test_parse_date_valid():
 def test_parse_date_invalid():
     assert parse_date("16-12-2025") is None
     assert parse_date("") is None
+    assert parse_date("2025-02-30") is None
+    assert parse_date("20251216") is None
+
+
+@pytest.mark.parametrize(
+    "category, description, amount, message",
+    [
+        ("", "", 0, "Category cannot be empty"),
+        ("x" * 31, "", 0, "Category too long"),
+        ("food", "", 0, "Description cannot be empty"),
+        ("food", "x" * 121, 0, "Description too long"),
+        ("food", "rice", 0, "Amount must be greater than 0"),
+    ],
+)
+def test_validate_all_reports_first_failure(category, description, amount, message):
+    with pytest.raises(ValueError, match=message):
+        validate_all(category, description, amount)
+
+
+def test_validate_all_accepts_valid_fields():
+    validate_all("x" * 30, "x" * 120, 0.01)
 
 
 def test_add_and_total(tmp_path: Path):
-    db = tmp_path / "expenses.json"
+    db = tmp_path / "expenses.jsonl"
     store = ExpenseStore(db)
 
     store.load()
@@ -30,10 +51,11 @@ def test_add_and_total(tmp_path: Path):
     assert store.total_spending() == pytest.approx(13.5)
     assert store.total_spending(category="food") == pytest.approx(10.5)
     assert store.total_spending(category="FOOD") == pytest.approx(10.5)
+    assert store.total_spending(category="rent") == 0
 
 
 def test_persistence(tmp_path: Path):
-    db = tmp_path / "expenses.json"
+    db = tmp_path / "expenses.jsonl"
 
     store1 = ExpenseStore(db)
     store1.expenses = []
@@ -45,10 +67,210 @@ def test_persistence(tmp_path: Path):
     assert store2.total_spending() == pytest.approx(5.0)
 
 
-def test_corrupt_db_raises(tmp_path: Path):
+def test_assigning_expenses_updates_totals_and_file(tmp_path: Path):
+    db = tmp_path / "expenses.jsonl"
+    store = ExpenseStore(db)
+    store.expenses = [Expense(date=date(2025, 12, 16), category="food", description="rice", amount=5.0)]
+    assert store.total_spending() == pytest.approx(5.0)
+    assert store.total_spending(category="food") == pytest.approx(5.0)
+
+    store.add_expense(Expense(date=date(2025, 12, 17), category="food", description="tea", amount=1.5))
+    reloaded = ExpenseStore(db)
+    reloaded.load()
+    assert [e.description for e in reloaded.list_expenses()] == ["rice", "tea"]
+
+
+def test_batched_writes_flush_on_exit(tmp_path: Path):
+    db = tmp_path / "expenses.jsonl"
+
+    with ExpenseStore(db, autosave=False) as store:
+        store.add_expense(Expense(date=date(2025, 12, 16), category="food", description="rice", amount=5.0))
+        store.add_expense(Expense(date=date(2025, 12, 17), category="food", description="tea", amount=1.5))
+        assert not db.exists()
+
+    reloaded = ExpenseStore(db)
+    reloaded.load()
+    assert len(reloaded.list_expenses()) == 2
+    assert reloaded.total_spending(category="food") == pytest.approx(6.5)
+
+
+def test_round_trips_surrogate_escaped_text(tmp_path: Path):
+    db = tmp_path / "expenses.jsonl"
+    store = ExpenseStore(db)
+    store.add_expense(Expense(date=date(2025, 12, 16), category="food", description="caf\udce9", amount=5.0))
+
+    reloaded = ExpenseStore(db)
+    reloaded.load()
+    assert reloaded.list_expenses()[0].description == "caf\udce9"
+
+
+def test_unserializable_expense_leaves_store_unchanged(tmp_path: Path):
+    db = tmp_path / "expenses.jsonl"
+    store = ExpenseStore(db)
+    with pytest.raises(TypeError):
+        store.add_expense(Expense(date=date(2025, 12, 16), category="food", description=object(), amount=5.0))
+    assert store.list_expenses() == []
+    assert store.total_spending() == 0
+
+    store.add_expense(Expense(date=date(2025, 12, 16), category="food", description="rice", amount=5.0))
+    reloaded = ExpenseStore(db)
+    reloaded.load()
+    assert [e.description for e in reloaded.list_expenses()] == ["rice"]
+
+
+def test_load_flushes_pending_expenses(tmp_path: Path):
+    db = tmp_path / "expenses.jsonl"
+    store = ExpenseStore(db, autosave=False)
+    store.add_expense(Expense(date=date(2025, 12, 16), category="food", description="rice", amount=5.0))
+
+    store.load()
+    assert [e.description for e in store.list_expenses()] == ["rice"]
+    assert len(db.read_text(encoding="utf-8").splitlines()) == 1
+
+
+def test_add_appends_one_line(tmp_path: Path):
+    db = tmp_path / "expenses.jsonl"
+    store = ExpenseStore(db)
+    store.load()
+
+    store.add_expense(Expense(date=date(2025, 12, 16), category="food", description="rice", amount=5.0))
+    store.add_expense(Expense(date=date(2025, 12, 17), category="travel", description="bus", amount=3.0))
+
+    lines = db.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["description"] for line in lines] == ["rice", "bus"]
+
+
+def test_append_after_missing_trailing_newline(tmp_path: Path):
+    db = tmp_path / "expenses.jsonl"
+    db.write_text('{"date":"2025-12-16","category":"food","description":"rice","amount":5.0}', encoding="utf-8")
+
+    store = ExpenseStore(db)
+    store.load()
+    store.add_expense(Expense(date=date(2025, 12, 17), category="food", description="tea", amount=1.5))
+
+    reloaded = ExpenseStore(db)
+    reloaded.load()
+    assert [e.description for e in reloaded.list_expenses()] == ["rice", "tea"]
+
+
+def test_legacy_json_list_is_migrated(tmp_path: Path):
     db = tmp_path / "expenses.json"
-    db.write_text(json.dumps({"not": "a list"}), encoding="utf-8")
+    legacy = [{"date": "2025-12-16", "category": "food", "description": "pizza", "amount": 12.0}]
+    db.write_text("\n\n" + json.dumps(legacy, indent=2), encoding="utf-8")
+
+    store = ExpenseStore(db)
+    store.load()
+    assert store.total_spending() == pytest.approx(12.0)
+    assert len(db.read_text(encoding="utf-8").splitlines()) == 1
+
+    store.add_expense(Expense(date=date(2025, 12, 17), category="food", description="tea", amount=1.5))
+    assert len(db.read_text(encoding="utf-8").splitlines()) == 2
+
+    reloaded = ExpenseStore(db)
+    reloaded.load()
+    assert reloaded.total_spending(category="food") == pytest.approx(13.5)
+
+
+def test_torn_last_line_is_skipped(tmp_path: Path):
+    db = tmp_path / "expenses.jsonl"
+    db.write_text(
+        '{"date":"2025-12-16","category":"food","description":"rice","amount":5.0}\n'
+        '{"date":"2025-12-17","category":"food","description":"tea","amount":1.5}\n'
+        '{"date":"2025-12-1',
+        encoding="utf-8",
+    )
+
+    store = ExpenseStore(db)
+    with pytest.warns(RuntimeWarning, match="incomplete last line 3"):
+        store.load()
+    assert store.total_spending() == pytest.approx(6.5)
+
+    store.add_expense(Expense(date=date(2025, 12, 18), category="food", description="bun", amount=2.0))
+    reloaded = ExpenseStore(db)
+    reloaded.load()
+    assert [e.description for e in reloaded.list_expenses()] == ["rice", "tea", "bun"]
+
+
+@pytest.mark.parametrize("autosave", [True, False])
+def test_add_before_load_onto_legacy_list(tmp_path: Path, autosave):
+    db = tmp_path / "expenses.json"
+    legacy = [{"date": "2025-12-16", "category": "food", "description": "pizza", "amount": 12.0}]
+    db.write_text(json.dumps(legacy, indent=2), encoding="utf-8")
+
+    store = ExpenseStore(db, autosave=autosave)
+    store.add_expense(Expense(date=date(2025, 12, 17), category="food", description="tea", amount=1.5))
+    store.load()
+    assert [e.description for e in store.list_expenses()] == ["pizza", "tea"]
+
+    reloaded = ExpenseStore(db)
+    reloaded.load()
+    assert reloaded.total_spending() == pytest.approx(13.5)
+
+
+def test_default_store_add_before_load_keeps_legacy_json(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    legacy = [{"date": "2025-12-16", "category": "food", "description": "pizza", "amount": 12.0}]
+    (tmp_path / "expenses.json").write_text(json.dumps(legacy), encoding="utf-8")
+
+    ExpenseStore().add_expense(Expense(date=date(2025, 12, 17), category="food", description="tea", amount=1.5))
+
+    store = ExpenseStore()
+    store.load()
+    assert [e.description for e in store.list_expenses()] == ["pizza", "tea"]
+
+
+def test_default_store_migrates_legacy_json(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    legacy = [{"date": "2025-12-16", "category": "food", "description": "pizza", "amount": 12.0}]
+    (tmp_path / "expenses.json").write_text(json.dumps(legacy, indent=2), encoding="utf-8")
+
+    store = ExpenseStore()
+    store.load()
+    assert [e.description for e in store.list_expenses()] == ["pizza"]
+    assert (tmp_path / "expenses.jsonl").exists()
+    assert (tmp_path / "expenses.json").exists()
+
+    reloaded = ExpenseStore()
+    reloaded.load()
+    assert reloaded.total_spending() == pytest.approx(12.0)
+
+
+def test_to_dict_omits_derived_fields():
+    e = Expense(date=date(2025, 12, 16), category="Food", description="rice", amount=5.0)
+    assert e.category_lc == "food"
+    assert e.to_dict() == {"date": "2025-12-16", "category": "Food", "description": "rice", "amount": 5.0}
+
+
+def test_from_dict_validates_untrusted_input():
+    data = {"date": "2025-12-16", "category": "   ", "description": "rice", "amount": 5}
+    with pytest.raises(ValueError, match="Category cannot be empty"):
+        Expense.from_dict(data)
+
+    data["category"] = " food "
+    assert Expense.from_dict(data).category == "food"
+
+
+def test_from_dict_trusted_skips_strip_and_validation_only():
+    data = {"date": "2025-12-16", "category": " food ", "description": "", "amount": -5}
+    e = Expense.from_dict(data, trusted=True)
+    assert (e.category, e.description, e.amount) == (" food ", "", -5.0)
+
+    for bad_date in ("20251216", "2025-W50-2", "2025-1-5"):
+        with pytest.raises(ValueError, match="Invalid date"):
+            Expense.from_dict({**data, "date": bad_date}, trusted=True)
+
+    with pytest.raises(KeyError):
+        Expense.from_dict({"date": "2025-12-16"}, trusted=True)
+
+
+def test_corrupt_db_raises(tmp_path: Path):
+    db = tmp_path / "expenses.jsonl"
+    db.write_text(
+        '{"date":"2025-12-16","category":"food","description":"rice","amount":5.0}\n'
+        '{"date":"2025-12-17","categ\n',
+        encoding="utf-8",
+    )
 
     store = ExpenseStore(db)
-    with pytest.raises(RuntimeError):
+    with pytest.raises(RuntimeError, match=r"Failed to load database '.*expenses\.jsonl': line 2: "):
         store.load()